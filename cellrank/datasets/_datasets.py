@@ -63,17 +63,17 @@ def _load_dataset_from_url(
         fpath += ".h5ad"
 
     if os.path.isfile(fpath):
-        logg.debug(f"Loading dataset from `{fpath!r}`")
+        logg.debug("Loading dataset from `%r`", fpath)
     else:
-        logg.debug(f"Downloading dataset from `{url!r}` as `{fpath!r}`")
+        logg.debug("Downloading dataset from `%r` as `%r`", url, fpath)
 
     dirname, _ = os.path.split(fpath)
     try:
         if not os.path.isdir(dirname):
-            logg.debug(f"Creating directory `{dirname!r}`")
+            logg.debug("Creating directory `%r`", dirname)
             os.makedirs(dirname, exist_ok=True)
     except OSError as e:
-        logg.debug(f"Unable to create directory `{dirname!r}`. Reason `{e}`")
+        logg.debug("Unable to create directory `%r`. Reason `%s`", dirname, e)
 
     kwargs.setdefault("sparse", True)
     kwargs.setdefault("cache", True)
@@ -1,6 +1,6 @@
 """Logging module."""
 
-from typing import Optional
+from typing import Any, Optional
 
 import logging
 from logging import INFO, DEBUG, ERROR, WARNING, CRITICAL
@@ -15,50 +15,70 @@ class _RootLogger(logging.RootLogger):
     def __init__(self, level):
         super().__init__(level)
         self.propagate = False
+        self._handlers_initialized = False
         _RootLogger.manager = logging.Manager(self)
 
+    def removeHandler(self, hdlr: logging.Handler) -> None:
+        # both ours and scanpy's `settings.logfile` setter replace the handler using this method
+        # closing flushes the records buffered in a `MemoryHandler`, otherwise they would be lost
+        # `flush()` is not called directly, since the stream of e.g. a `StreamHandler` might be already closed
+        if hdlr in self.handlers:
+            hdlr.close()
+        super().removeHandler(hdlr)
+
     def log(
         self,
         level: int,
         msg: str,
-        *,
+        *args: Any,
         extra: Optional[dict] = None,
         time: datetime = None,
         deep: Optional[str] = None,
     ) -> datetime:
-        from cellrank import settings
+        if not self._handlers_initialized:
+            from cellrank import settings
 
-        # this will correctly initialize the handles if doing
-        # just from cellrank import logging
-        settings.verbosity = settings.verbosity
+            # this will correctly initialize the handles if doing
+            # just from cellrank import logging
+            # afterwards, the verbosity setter keeps the levels in sync
+            settings.verbosity = settings.verbosity
+            self._handlers_initialized = True
 
         now = datetime.now(timezone.utc)
+        if not self.isEnabledFor(level):
+            # skip creating the record, but still return the time, since callers can chain it
+            return now
+
+        deep = deep if self.level < level else None
+        if deep is not None and args:
+            # the formatters append `deep` to the unformatted message, which might contain a `%`
+            msg, args = msg % args, ()
         time_passed: timedelta = None if time is None else now - time
         extra = {
             **(extra or {}),
-            "deep": deep if settings.verbosity.level < level else None,
+            "deep": deep,
             "time_passed": time_passed,
         }
-        super().log(level, msg, extra=extra)
+        super().log(level, msg, *args, extra=extra)
         return now
 
-    def critical(self, msg, *, time=None, deep=None, extra=None) -> datetime:
-        return self.log(CRITICAL, msg, time=time, deep=deep, extra=extra)
+    def critical(self, msg, *args, time=None, deep=None, extra=None) -> datetime:
+        return self.log(CRITICAL, msg, *args, time=time, deep=deep, extra=extra)
 
-    def error(self, msg, *, time=None, deep=None, extra=None) -> datetime:
-        return self.log(ERROR, msg, time=time, deep=deep, extra=extra)
+    def error(self, msg, *args, time=None, deep=None, extra=None) -> datetime:
+        return self.log(ERROR, msg, *args, time=time, deep=deep, extra=extra)
 
-    def warning(self, msg, *, time=None, deep=None, extra=None) -> datetime:
-        return self.log(WARNING, msg, time=time, deep=deep, extra=extra)
+    def warning(self, msg, *args, time=None, deep=None, extra=None) -> datetime:
+        return self.log(WARNING, msg, *args, time=time, deep=deep, extra=extra)
 
-    def info(self, msg, *, time=None, deep=None, extra=None) -> datetime:
-        return self.log(INFO, msg, time=time, deep=deep, extra=extra)
+    def info(self, msg, *args, time=None, deep=None, extra=None) -> datetime:
+        return self.log(INFO, msg, *args, time=time, deep=deep, extra=extra)
 
-    def hint(self, msg, *, time=None, deep=None, extra=None) -> datetime:
-        return self.log(HINT, msg, time=time, deep=deep, extra=extra)
+    def hint(self, msg, *args, time=None, deep=None, extra=None) -> datetime:
+        return self.log(HINT, msg, *args, time=time, deep=deep, extra=extra)
 
-    def debug(self, msg, *, time=None, deep=None, extra=None) -> datetime:
-        return self.log(DEBUG, msg, time=time, deep=deep, extra=extra)
+    def debug(self, msg, *args, time=None, deep=None, extra=None) -> datetime:
+        return self.log(DEBUG, msg, *args, time=time, deep=deep, extra=extra)
 
 
 class _LogFormatter(logging.Formatter):
@@ -66,15 +86,25 @@ class _LogFormatter(logging.Formatter):
         self, fmt="{levelname}: {message}", datefmt="%Y-%m-%d %H:%M", style="{"
     ):
         super().__init__(fmt, datefmt, style)
+        # the formats are created once, instead of modifying `self._style` for each record
+        level_fmts = {
+            None: fmt,
+            INFO: "{message}",
+            HINT: "--> {message}",
+            DEBUG: "DEBUG: {message}",
+        }
+        self._formatters = {
+            (level, show_time): logging.Formatter(
+                f"{level_fmt} ({{time_passed}})" if show_time else level_fmt,
+                datefmt,
+                style,
+            )
+            for level, level_fmt in level_fmts.items()
+            for show_time in (False, True)
+        }
 
     def format(self, record: logging.LogRecord):
-        format_orig = self._style._fmt
-        if record.levelno == INFO:
-            self._style._fmt = "{message}"
-        elif record.levelno == HINT:
-            self._style._fmt = "--> {message}"
-        elif record.levelno == DEBUG:
-            self._style._fmt = "DEBUG: {message}"
+        show_time = False
         if record.time_passed:
             # strip microseconds
             if record.time_passed.microseconds:
@@ -86,12 +116,14 @@ class _LogFormatter(logging.Formatter):
                     "{time_passed}", str(record.time_passed)
                 )
             else:
-                self._style._fmt += " ({time_passed})"
+                show_time = True
         if record.deep:
             record.msg = f"{record.msg}: {record.deep}"
-        result = logging.Formatter.format(self, record)
-        self._style._fmt = format_orig
-        return result
+
+        formatter = self._formatters.get(
+            (record.levelno, show_time), self._formatters[None, show_time]
+        )
+        return formatter.format(record)
 
 
 _DEPENDENCIES_NUMERICS = [
@@ -104,7 +136,8 @@ _DEPENDENCIES_NUMERICS = [
     "pygpcca",
     ("sklearn", "scikit-learn"),
     "statsmodels",
-    ("igraph", "python-igraph"),
+    # `python-igraph` was renamed to `igraph` in `0.10`
+    ("igraph", ("igraph", "python-igraph")),
     "scvelo",
     "pygam",
 ]
@@ -115,16 +148,34 @@ _DEPENDENCIES_PLOTTING = ["matplotlib", "seaborn"]
 
 def _versions_dependencies(dependencies):
     # this is not the same as the requirements!
+    try:
+        from importlib.metadata import version  # Python >= 3.8
+    except ImportError:
+        from importlib_metadata import version  # Python < 3.8
+
     for mod in dependencies:
-        mod_name, dist_name = mod if isinstance(mod, tuple) else (mod, mod)
-        try:
-            imp = __import__(mod_name)
-            if mod == "cellrank":
-                yield dist_name, imp.__full_version__
-            else:
-                yield dist_name, imp.__version__
-        except (ImportError, AttributeError):
-            pass
+        mod_name, dist_names = mod if isinstance(mod, tuple) else (mod, mod)
+        if isinstance(dist_names, str):
+            dist_names = (dist_names,)
+        if mod == "cellrank":
+            from cellrank import __full_version__
+
+            yield mod, __full_version__
+            continue
+        # read the distribution's metadata, without importing the module
+        for dist_name in dist_names:
+            try:
+                ver = version(dist_name)
+            except ImportError:  # `PackageNotFoundError` is a subclass
+                continue
+            yield dist_name, ver
+            break
+        else:
+            # the distribution might be installed under a name not listed above
+            try:
+                yield dist_names[0], __import__(mod_name).__version__
+            except (ImportError, AttributeError):
+                pass
 
 
 def print_versions():
@@ -153,13 +204,27 @@ def print_version_and_date():
     )
 
 
+_root_logger: Optional[_RootLogger] = None
+
+
+def _get_root_logger() -> _RootLogger:
+    global _root_logger
+
+    if _root_logger is None:
+        from cellrank import settings
+
+        _root_logger = settings._root_logger
+
+    return _root_logger
+
+
 def _copy_docs_and_signature(fn):
     return partial(update_wrapper, wrapped=fn, assigned=["__doc__", "__annotations__"])
 
 
 def error(
     msg: str,
-    *,
+    *args: Any,
     time: datetime = None,
     deep: Optional[str] = None,
     extra: Optional[dict] = None,
@@ -171,6 +236,8 @@ def error(
     ----------
     msg
         Message to display.
+    args
+        Arguments which are merged into ``msg`` using ``%``-formatting, only if the message is displayed.
     time
         A time in the past. If this is passed, the time difference from then
         to now is appended to `msg` as ` (HH:MM:SS)`.
@@ -187,34 +254,24 @@ def error(
     :class:`datetime.datetime`
         The current time.
     """
-    from cellrank import settings
-
-    return settings._root_logger.error(msg, time=time, deep=deep, extra=extra)
+    return _get_root_logger().error(msg, *args, time=time, deep=deep, extra=extra)
 
 
 @_copy_docs_and_signature(error)
-def warning(msg: str, *, time=None, deep=None, extra=None) -> datetime:  # noqa
-    from cellrank import settings
-
-    return settings._root_logger.warning(msg, time=time, deep=deep, extra=extra)
+def warning(msg: str, *args, time=None, deep=None, extra=None) -> datetime:  # noqa
+    return _get_root_logger().warning(msg, *args, time=time, deep=deep, extra=extra)
 
 
 @_copy_docs_and_signature(error)
-def info(msg: str, *, time=None, deep=None, extra=None) -> datetime:  # noqa
-    from cellrank import settings
-
-    return settings._root_logger.info(msg, time=time, deep=deep, extra=extra)
+def info(msg: str, *args, time=None, deep=None, extra=None) -> datetime:  # noqa
+    return _get_root_logger().info(msg, *args, time=time, deep=deep, extra=extra)
 
 
 @_copy_docs_and_signature(error)
-def hint(msg: str, *, time=None, deep=None, extra=None) -> datetime:  # noqa
-    from cellrank import settings
-
-    return settings._root_logger.hint(msg, time=time, deep=deep, extra=extra)
+def hint(msg: str, *args, time=None, deep=None, extra=None) -> datetime:  # noqa
+    return _get_root_logger().hint(msg, *args, time=time, deep=deep, extra=extra)
 
 
 @_copy_docs_and_signature(error)
-def debug(msg: str, *, time=None, deep=None, extra=None) -> datetime:  # noqa
-    from cellrank import settings
-
-    return settings._root_logger.debug(msg, time=time, deep=deep, extra=extra)
+def debug(msg: str, *args, time=None, deep=None, extra=None) -> datetime:  # noqa
+    return _get_root_logger().debug(msg, *args, time=time, deep=deep, extra=extra)
@@ -216,7 +216,7 @@ def circular_projection(
         lineage_order = (
             LineageOrder.OPTIMAL if 3 < n_lin <= 20 else LineageOrder.DEFAULT
         )
-        logg.debug(f"Set ordering to `{lineage_order}`")
+        logg.debug("Set ordering to `%s`", lineage_order)
     lineage_order = LineageOrder(lineage_order)
 
     if lineage_order == LineageOrder.OPTIMAL:
@@ -257,7 +257,7 @@ def circular_projection(
         set_lognorm, colorbar = False, kwargs.pop("colorbar", True)
         try:
             _ = PrimingDegree(k)
-            logg.debug(f"Calculating priming degree using `method={k}`")
+            logg.debug("Calculating priming degree using `method=%s`", k)
             val = probs.priming_degree(method=k, early_cells=early_cells)
             k = f"{lineage_key}_{k}"
             adata.obs[k] = val
@@ -443,7 +443,8 @@ def cluster_fates(
             clusters = _unique_order_preserving(clusters)
             if mode in (mode.PAGA, mode.PAGA_PIE):
                 logg.debug(
-                    f"Setting `clusters` to all available ones because of `mode={mode!r}`"
+                    "Setting `clusters` to all available ones because of `mode=%r`",
+                    mode,
                 )
                 clusters = list(adata.obs[cluster_key].cat.categories)
             else:
@@ -486,7 +487,7 @@ def cluster_fates(
         std = np.nanstd(data, axis=0) / np.sqrt(data.shape[0])
         d[name] = [mean, std]
 
-    logg.debug(f"Plotting in mode `{mode!r}`")
+    logg.debug("Plotting in mode `%r`", mode)
     use_clustermap = False
     if mode == mode.CLUSTERMAP:
         use_clustermap = True
@@ -261,7 +261,7 @@ def graph(
         self_loop_radius_frac = (
             node_size / 2000 if node_size >= 200 else node_size / 1000
         )
-        logg.debug(f"Setting self loop radius fraction to `{self_loop_radius_frac}`")
+        logg.debug("Setting self loop radius fraction to `%s`", self_loop_radius_frac)
 
     if isinstance(keys, str):
         keys = [keys]
@@ -383,27 +383,20 @@ def graph(
 
     curves, lc = None, None
     if edge_use_curved:
-        try:
-            from cellrank.pl._utils import _curved_edges
-
-            logg.debug("Creating curved edges")
-            curves = _curved_edges(G, pos, self_loop_radius_frac, polarity="directed")
-            lc = LineCollection(
-                curves,
-                colors="black",
-                linewidths=np.clip(
-                    np.ravel([v["weight"] for v in G.edges.values()])
-                    * edge_weight_scale,
-                    0,
-                    edge_width_limit,
-                ),
-                alpha=edge_alpha,
-            )
-        except ImportError:
-            logg.error(
-                "Unable to show curved edges. Please install `bezier` as `pip install bezier` or "
-                "use `edge_use_curved=False`"
-            )
+        from cellrank.pl._utils import _curved_edges
+
+        logg.debug("Creating curved edges")
+        curves = _curved_edges(G, pos, self_loop_radius_frac, polarity="directed")
+        lc = LineCollection(
+            curves,
+            colors="black",
+            linewidths=np.clip(
+                np.ravel([v["weight"] for v in G.edges.values()]) * edge_weight_scale,
+                0,
+                edge_width_limit,
+            ),
+            alpha=edge_alpha,
+        )
 
     for ax, keyloc, title, key, labs, er in zip(
         axes, keylocs, title, keys, labels, edge_reductions
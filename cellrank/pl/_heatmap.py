@@ -552,7 +552,7 @@ def heatmap(
 
     xlabel = time_key if xlabel is None else xlabel
 
-    logg.debug(f"Plotting `{mode!r}` heatmap")
+    logg.debug("Plotting `%r` heatmap", mode)
     fig, genes = _plot_heatmap(mode)
 
     if save is not None and fig is not None:
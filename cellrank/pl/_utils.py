@@ -11,7 +11,9 @@ from typing import (
     Sequence,
 )
 
+import sys
 from copy import copy
+from time import perf_counter
 from pathlib import Path
 from itertools import combinations
 from collections import namedtuple, defaultdict
@@ -44,6 +46,8 @@ _ERROR_INCOMPLETE_SPEC = (
     "No options were specified for {}. "
     "Consider specifying a fallback model using '*'."
 )
+# minimum time in seconds between progress bar updates sent from the workers
+_PROGRESS_UPDATE_INTERVAL = 0.1
 _time_range_type = Optional[Union[float, Tuple[Optional[float], Optional[float]]]]
 _return_model_type = Mapping[str, Mapping[str, BaseModel]]
 _input_model_type = Union[BaseModel, _return_model_type]
@@ -52,6 +56,44 @@ _callback_type = Optional[Union[Callable, Mapping[str, Mapping[str, Callable]]]]
 BulkRes = namedtuple("BulkRes", ["x_test", "y_test"])
 
 
+class _LazyModelDict(Mapping[Optional[str], BaseModel]):
+    """
+    Lineage-specific models which are created by copying a shared model on first access.
+
+    Parameters
+    ----------
+    model
+        Model to copy.
+    lineages
+        Lineages for which to create the models.
+    """
+
+    def __init__(self, model: BaseModel, lineages: Sequence[Optional[str]]):
+        self._model = model
+        self._lineages = tuple(lineages)
+        self._models: Dict[Optional[str], BaseModel] = {}
+
+    @property
+    def model(self) -> BaseModel:
+        """Model which is copied for each lineage."""
+        return self._model
+
+    def __getitem__(self, lineage: Optional[str]) -> BaseModel:
+        try:
+            return self._models[lineage]
+        except KeyError:
+            if lineage not in self._lineages:
+                raise KeyError(lineage) from None
+            model = self._models[lineage] = copy(self.model)
+            return model
+
+    def __iter__(self):
+        return iter(self._lineages)
+
+    def __len__(self) -> int:
+        return len(self._lineages)
+
+
 def _curved_edges(
     G: Graph,
     pos: Mapping,
@@ -84,11 +126,6 @@ def _curved_edges(
     Array of shape ``(n_edges, bezier_precision, 2)`` containing the curved edges.
     """
 
-    try:
-        import bezier
-    except ImportError as e:
-        raise ImportError("Please install `bezier` as `pip install bezier`.") from e
-
     # Get nodes into np array
     edges = np.array(G.edges())
     n_edges = edges.shape[0]
@@ -96,20 +133,31 @@ def _curved_edges(
     self_loop_mask = edges[:, 0] == edges[:, 1]
     pos_sl = {edge[0]: pos[edge[0]] for edge in edges[self_loop_mask, ...]}
 
+    # Unique nodes and their indices for each edge
+    u, inv = np.unique(edges, return_inverse=True)
+    inv = inv.reshape(edges.shape)
+
     if polarity == "random":
-        # Random polarity of curve
-        rnd = np.where(np.random.randint(2, size=n_edges) == 0, -1, 1)
+        # Random polarity of curve, mapping {0, 1} to {-1, 1} directly
+        rnd = np.random.randint(2, size=n_edges, dtype=np.int8) * 2 - 1
     elif polarity == "directed":
         rnd = np.where(edges[:, 0] > edges[:, 1], -1, 1)
     elif polarity == "fixed":
         # Create a fixed (hashed) polarity column in the case we use fixed polarity
         # This is useful, e.g., for animations
-        rnd = np.where(
-            np.mod(np.vectorize(hash)(edges[:, 0]) + np.vectorize(hash)(edges[:, 1]), 2)
-            == 0,
-            -1,
-            1,
-        )
+        # Hash only the unique nodes and gather them for each edge
+        if (
+            u.dtype.kind in "iu"
+            and len(u)
+            and 0 <= u[0]
+            and u[-1] < sys.hash_info.modulus
+        ):
+            # non-negative integers smaller than the modulus are their own hash
+            hashes = u[inv]
+        else:
+            hashes = np.array([hash(n) for n in u], dtype=np.int64)[inv]
+        # only the parity of the sum of the hashes is needed
+        rnd = np.where((hashes[:, 0] ^ hashes[:, 1]) & 1, 1, -1)
     else:
         raise ValueError(
             f"Polarity `{polarity!r}` is not a valid option. "
@@ -118,41 +166,35 @@ def _curved_edges(
 
     # Coordinates (x, y) of both nodes for each edge
     # Note the np.vectorize method doesn't work for all node position dictionaries for some reason
-    u, inv = np.unique(edges, return_inverse=True)
-    coords = np.array([pos[x] for x in u])[inv].reshape(
-        [edges.shape[0], 2, edges.shape[1]]
-    )
-    coords_node1 = coords[:, 0, :]
-    coords_node2 = coords[:, 1, :]
+    coords = np.array([pos[x] for x in u], dtype=np.float64)
 
     # Swap node1/node2 allocations to make sure the directionality works correctly
-    should_swap = coords_node1[:, 0] > coords_node2[:, 0]
-    coords_node1[should_swap], coords_node2[should_swap] = (
-        coords_node2[should_swap],
-        coords_node1[should_swap],
-    )
+    # This is done on the indices, so that the coordinates are gathered only once
+    should_swap = coords[inv[:, 0], 0] > coords[inv[:, 1], 0]
+    inv[should_swap] = inv[should_swap, ::-1]
+    coords_node1 = coords[inv[:, 0]]
+    coords_node2 = coords[inv[:, 1]]
+
+    # Unit vector along the line connecting the nodes; self loops have no direction
+    # This also handles vertical and horizontal lines, unlike using the gradients
+    delta = coords_node2 - coords_node1
+    length = np.hypot(delta[:, 0], delta[:, 1])[:, None]
+    unit = np.divide(delta, length, out=np.zeros_like(delta), where=length > 0)
 
     # Distance for control points
-    dist = dist_ratio * np.sqrt(np.sum((coords_node1 - coords_node2) ** 2, axis=1))
-
-    # Gradients of line connecting node & perpendicular
-    m1 = (coords_node2[:, 1] - coords_node1[:, 1]) / (
-        coords_node2[:, 0] - coords_node1[:, 0]
-    )
-    m2 = -1 / m1
+    dist = dist_ratio * length
 
     # Temporary points along the line which connects two nodes
-    t1 = dist / np.sqrt(1 + m1**2)
-    v1 = np.array([np.ones(n_edges), m1])
-    coords_node1_displace = coords_node1 + (v1 * t1).T
-    coords_node2_displace = coords_node2 - (v1 * t1).T
+    coords_node1_displace = coords_node1 + dist * unit
+    coords_node2_displace = coords_node2 - dist * unit
 
     # Control points, same distance but along perpendicular line
     # rnd gives the 'polarity' to determine which side of the line the curve should arc
-    t2 = dist / np.sqrt(1 + m2**2)
-    v2 = np.array([np.ones(len(edges)), m2])
-    coords_node1_ctrl = coords_node1_displace + (rnd * v2 * t2).T
-    coords_node2_ctrl = coords_node2_displace + (rnd * v2 * t2).T
+    # the side also depends on the direction of the line on the y-axis
+    side = (rnd * np.where(delta[:, 1] < 0, -1, 1))[:, None]
+    perp = side * dist * np.c_[unit[:, 1], -unit[:, 0]]
+    coords_node1_ctrl = coords_node1_displace + perp
+    coords_node2_ctrl = coords_node2_displace + perp
 
     # Combine all these four (x,y) columns into a 'node matrix'
     node_matrix = np.array(
@@ -161,23 +203,16 @@ def _curved_edges(
 
     nums = np.linspace(0, 2 * np.pi, bezier_precision)
 
-    # Create the Bezier curves and store them in a list
-
     self_loops = []
     for p in pos_sl.values():
         self_loops.append(np.c_[np.cos(nums), np.sin(nums)] * radius_fraction + p)
 
-    curveplots = []
-    for i in range(len(edges)):
-        nodes = node_matrix[:, i, :].T
-        curveplots.append(
-            bezier.Curve(nodes, degree=3)
-            .evaluate_multi(np.linspace(0, 1, bezier_precision))
-            .T
-        )
-
-    # Return an array of these curves
-    curves = np.array(curveplots)
+    # Bernstein basis of the cubic Bezier curves, evaluated for all edges at once
+    t = np.linspace(0, 1, bezier_precision)[:, None]
+    weights = np.hstack(
+        [(1 - t) ** 3, 3 * (1 - t) ** 2 * t, 3 * (1 - t) * t**2, t**3]
+    )
+    curves = np.einsum("tk,ked->etd", weights, node_matrix)
     if np.any(self_loop_mask):
         curves[self_loop_mask, ...] = self_loops
 
@@ -200,7 +235,12 @@ def _is_any_gam_mgcv(models: Union[BaseModel, Dict[str, Dict[str, BaseModel]]])
 
     return isinstance(models, GAMR) or (
         isinstance(models, dict)
-        and any(isinstance(m, GAMR) for ms in models.values() for m in ms.values())
+        and any(
+            isinstance(m, GAMR)
+            for ms in models.values()
+            # don't create the copies just to check their type
+            for m in ((ms.model,) if isinstance(ms, _LazyModelDict) else ms.values())
+        )
     )
 
 
@@ -253,11 +293,12 @@ def _create_models(
                 )
             models[obs_name][lin_name] = copy(mod)
 
-        if set(models[obs_name].keys()) & lineages == lineages:
+        missing_lineages = lineages - models[obs_name].keys()
+        if not missing_lineages:
             return
 
         if lin_rest_model is not None:
-            for lin_name in lineages - set(models[obs_name].keys()):
+            for lin_name in missing_lineages:
                 models[obs_name][lin_name] = copy(lin_rest_model)
         else:
             raise ValueError(
@@ -271,9 +312,10 @@ def _create_models(
         raise ValueError("No genes have been selected.")
 
     if isinstance(model, BaseModel):
+        # the models are copied only when needed, e.g. in the worker which fits them
+        lineages = _unique_order_preserving(lineages)
         return {
-            o: {lin: copy(model) for lin in _unique_order_preserving(lineages)}
-            for o in _unique_order_preserving(obs)
+            o: _LazyModelDict(model, lineages) for o in _unique_order_preserving(obs)
         }
 
     lineages, obs = (
@@ -308,15 +350,17 @@ def _create_models(
             f"a gene and lineage specific `dict` of `BaseModel`.."
         )
 
-    if set(models.keys()) & obs != obs:
+    missing_obs = obs - models.keys()
+    if missing_obs:
         raise ValueError(
-            f"Missing gene models for the following genes: `{list(obs - set(models.keys()))}`."
+            f"Missing gene models for the following genes: `{list(missing_obs)}`."
         )
 
     for gene, vs in models.items():
-        if set(vs.keys()) & lineages != lineages:
+        missing_lineages = lineages - vs.keys()
+        if missing_lineages:
             raise ValueError(
-                f"Missing lineage models for the gene `{gene!r}`: `{list(lineages - set(vs.keys()))}`."
+                f"Missing lineage models for the gene `{gene!r}`: `{list(missing_lineages)}`."
             )
 
     return models
@@ -368,6 +412,8 @@ def _fit_bulk_helper(
 
     conf_int = return_models and kwargs.pop("conf_int", False)
     res = {}
+    # number of genes not yet reported to the progress bar
+    n_pending, last_update = 0, perf_counter()
 
     for gene in genes:
         res[gene] = {}
@@ -393,9 +439,14 @@ def _fit_bulk_helper(
             )
 
         if queue is not None:
-            queue.put(1)
+            n_pending += 1
+            if perf_counter() - last_update >= _PROGRESS_UPDATE_INTERVAL:
+                queue.put(n_pending)
+                n_pending, last_update = 0, perf_counter()
 
     if queue is not None:
+        if n_pending:
+            queue.put(n_pending)
         queue.put(None)
 
     return res
@@ -541,9 +592,8 @@ def _filter_models(
             else "Consider specify `return_models=True` for further inspection."
         )
         logg.debug(
-            "The failed models were:\n`{}`".format(
-                "\n".join(f"    {m}" for m in failed_models)
-            )
+            "The failed models were:\n`%s`",
+            "\n".join(f"    {m}" for m in failed_models),
         )
 
     # lineages is the max number of lineages
@@ -709,9 +759,22 @@ def _trends_helper(
     ylabel_shown = False
     cells_shown = False
     obs_legend_loc = kwargs.pop("obs_legend_loc", "best")
+    gene_models = models[gene]
+    # keyword arguments which are the same for all lineages
+    plot_kwargs = dict(
+        fig=fig,
+        cell_color=cell_color,
+        cbar=False,
+        obs_legend_loc=None,
+        same_plot=same_plot,
+        lineage_probability_color=lineage_probability_color,
+        abs_prob_cmap=abs_prob_cmap,
+        lineage_probability=show_prob,
+        **kwargs,
+    )
 
     for i, (name, ax, perc) in enumerate(zip(lineage_names, axes, percs)):
-        model = models[gene][name]
+        model = gene_models[name]
         if isinstance(model, FailedModel):
             if not same_plot:
                 ax.remove()
@@ -738,20 +801,12 @@ def _trends_helper(
 
         model.plot(
             ax=ax,
-            fig=fig,
             perc=perc,
-            cell_color=cell_color,
-            cbar=False,
-            obs_legend_loc=None,
             title=title,
             hide_cells=True if hide_cells else cells_shown if same_plot else False,
-            same_plot=same_plot,
             lineage_color=lineage_color_mapper[name],
-            lineage_probability_color=lineage_probability_color,
-            abs_prob_cmap=abs_prob_cmap,
-            lineage_probability=show_prob,
             ylabel=ylabel,
-            **kwargs,
+            **plot_kwargs,
         )
         if sharey in ("row", "all", True) and not ylabel_shown:
             plt.setp(ax.get_yticklabels(), visible=True)
@@ -1113,14 +1168,21 @@ def composition(
 
     if key not in adata.obs:
         raise KeyError(f"Data not found in `adata.obs[{key!r}]`.")
-    if not is_categorical_dtype(adata.obs[key]):
+    data = adata.obs[key]
+    if not is_categorical_dtype(data):
         raise TypeError(
             f"Expected `adata.obs[{key!r}]` is not `categorical`, "
-            f"found `{infer_dtype(adata.obs[key])}`."
+            f"found `{infer_dtype(data)}`."
         )
 
     colors = adata.uns.get(f"{key}_colors", None)
-    x = adata.obs[key].value_counts()
+    # keep the categories' order, so that they match the colors
+    # NaN values have the code `-1`
+    codes = data.cat.codes.to_numpy()
+    x = pd.Series(
+        np.bincount(codes[codes >= 0], minlength=len(data.cat.categories)),
+        index=data.cat.categories,
+    )
 
     # plot these fractions in a pie plot
     fig, ax = plt.subplots(figsize=figsize, dpi=dpi)
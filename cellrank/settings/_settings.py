@@ -1,9 +1,26 @@
+import os
 import logging
+import warnings
 from copy import copy
+from logging.handlers import MemoryHandler
 
 from scanpy import settings
 from cellrank.logging._logging import _RootLogger, _LogFormatter
 
+_LOG_BUFFER_ENV = "CELLRANK_LOG_BUFFER"
+
+
+def _log_buffer_capacity() -> int:
+    value = os.environ.get(_LOG_BUFFER_ENV, "0")
+    try:
+        return max(int(value), 0)
+    except ValueError:
+        warnings.warn(
+            f"Unable to parse `{_LOG_BUFFER_ENV}={value!r}` as an integer. Not buffering the log messages",
+            stacklevel=2,
+        )
+        return 0
+
 
 def _set_log_file(settings):
     file = settings.logfile
@@ -11,6 +28,13 @@ def _set_log_file(settings):
     root = settings._root_logger
     h = logging.StreamHandler(file) if name is None else logging.FileHandler(name)
     h.setFormatter(_LogFormatter())
+    # buffering is opt-in, otherwise the messages would not be shown immediately, e.g. in notebooks
+    # note that setting `settings.logfile` goes through scanpy, which installs an unbuffered handler
+    capacity = _log_buffer_capacity()
+    if capacity > 0:
+        h = MemoryHandler(
+            capacity, flushLevel=logging.ERROR, target=h, flushOnClose=True
+        )
     h.setLevel(root.level)
 
     if len(root.handlers) == 1:
@@ -330,9 +330,10 @@ def _petsc_direct_solve(
 
     if not ksp.converged:
         logg.debug(
-            f"The solution for system "
-            f"`A{list(A.getSize())} * X{list(x.getSize())} = B{list(B.getSize())}` "
-            f"did not converge"
+            "The solution for system `A%s * X%s = B%s` did not converge",
+            list(A.getSize()),
+            list(x.getSize()),
+            list(B.getSize()),
         )
 
     return res
@@ -452,9 +453,11 @@ def _solve_lin_system(
         # as_array causes an issue, because it's called like this np.array([(NxM), (NxK), ....]
         # in the end, we want array of shape Nx(M + K + ...) - this is ensured by the extractor
         logg.debug(
-            f"Solving the linear system using `PETSc` solver `{('gmres' if solver is None else solver)!r}` "
-            f"on `{n_jobs}` core(s) with {'no' if preconditioner is None else preconditioner} preconditioner and "
-            f"`tol={tol}`"
+            "Solving the linear system using `PETSc` solver `%r` on `%s` core(s) with %s preconditioner and `tol=%s`",
+            "gmres" if solver is None else solver,
+            n_jobs,
+            "no" if preconditioner is None else preconditioner,
+            tol,
         )
 
         mat_x, n_converged = parallelize(
@@ -477,7 +480,10 @@ def _solve_lin_system(
             mat_b = csr_matrix(mat_b)
 
         logg.debug(
-            f"Solving the linear system using `scipy` solver `{solver!r}` on `{n_jobs} cores(s)` with `tol={tol}`"
+            "Solving the linear system using `scipy` solver `%r` on `%s cores(s)` with `tol=%s`",
+            solver,
+            n_jobs,
+            tol,
         )
 
         mat_x, n_converged = parallelize(
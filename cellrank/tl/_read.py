@@ -87,7 +87,7 @@ def read(
             adata.uns[names_key] = names
         else:
             logg.debug(
-                f"Unable to load {pretty_name}`Lineage` from `adata.obsm[{lin_key!r}]`"
+                "Unable to load %s`Lineage` from `adata.obsm[%r]`", pretty_name, lin_key
             )
 
     adata = read_callback(path, **kwargs)
@@ -330,6 +330,41 @@ def _mat_mat_corr_dense(X: np.ndarray, Y: np.ndarray) -> np.ndarray:
         return (X @ Y - (n * X_bar * y_bar)) / ((n - 1) * X_std * y_std)
 
 
+def _mat_vec_corr(X: Union[np.ndarray, spmatrix], y: np.ndarray) -> np.ndarray:
+    """Correlate the columns of ``X`` of shape ``(n_cells, n_genes)`` with ``y`` of shape ``(n_cells,)``."""
+    n = X.shape[0]
+    y = np.asarray(y, dtype=np.float64)
+
+    if issparse(X):
+        X_bar = np.ravel(X.mean(axis=0))
+        X_std = np.sqrt(np.ravel(X.power(2).mean(axis=0)) - X_bar**2)
+    else:
+        X_bar = np_mean(X, axis=0)
+        X_std = np_std(X, axis=0)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        corr = (np.ravel(X.T @ y) - n * X_bar * np.mean(y)) / (
+            (n - 1) * X_std * np.std(y)
+        )
+    corr[_invalid_corr(corr)] = np.nan
+
+    return corr
+
+
+def _invalid_corr(corr: np.ndarray) -> np.ndarray:
+    """Get the mask of correlations which are not in ``[-1, 1]`` and warn if there are any."""
+    invalid = (corr < -1) | (corr > 1)
+    if np.any(invalid):
+        logg.warning(
+            f"Found `{np.sum(invalid)}` correlation(s) that are not in `[-1, 1]`. "
+            f"This usually happens when gene expression is constant across all cells. "
+            f"Setting to `NaN`"
+        )
+
+    return invalid
+
+
 def _perm_test(
     ixs: np.ndarray,
     corr: np.ndarray,
@@ -417,13 +452,8 @@ def _correlation_test(
         confidence_level=confidence_level,
         **kwargs,
     )
-    invalid = (corr < -1) | (corr > 1)
+    invalid = _invalid_corr(corr)
     if np.any(invalid):
-        logg.warning(
-            f"Found `{np.sum(invalid)}` correlation(s) that are not in `[0, 1]`. "
-            f"This usually happens when gene expression is constant across all cells. "
-            f"Setting to `NaN`"
-        )
         corr[invalid] = np.nan
         pvals[invalid] = np.nan
         ci_low[invalid] = np.nan
@@ -764,7 +794,11 @@ def _symmetric(
         return ((matrix != 0) == (matrix != 0).T).all()
 
     if issparse(matrix):
-        return sparse_norm((matrix - matrix.T), ord=ord) < eps
+        diff = matrix - matrix.T
+        if ord in (None, "fro", "f"):
+            # older `scipy` versions compute the norm using 2 temporary matrices
+            return np.linalg.norm(diff.data) < eps
+        return sparse_norm(diff, ord=ord) < eps
     return d_norm((matrix - matrix.T), ord=ord) < eps
 
 
@@ -909,7 +943,7 @@ def save_fig(
     if make_dir:
         _maybe_create_dir(os.path.split(path)[0])
 
-    logg.debug(f"Saving figure to `{path!r}`")
+    logg.debug("Saving figure to `%r`", path)
 
     fig.savefig(path, bbox_inches="tight", transparent=True)
 
@@ -1192,7 +1226,7 @@ def _fuzzy_to_discrete(
         if raise_threshold is None
         else np.max([int(raise_threshold * n_most_likely), 1])
     )
-    logg.debug(f"Raising an exception if there are less than `{n_raise}` cells.")
+    logg.debug("Raising an exception if there are less than `%s` cells.", n_raise)
 
     # initially select `n_most_likely` samples per cluster
     sample_assignment = {
@@ -1514,7 +1548,7 @@ def _calculate_lineage_absorption_time_means(
         D_j_inv = D_j.copy()
         D_j_inv.data = 1.0 / D_j.data
 
-        logg.debug(f"Calculating mean time to absorption to `{name!r}`")
+        logg.debug("Calculating mean time to absorption to `%r`", name)
         m = _solve_lin_system(
             D_j_inv @ N_inv @ D_j, np.ones(Q.shape[0]), **kwargs
         ).squeeze()
@@ -1527,7 +1561,7 @@ def _calculate_lineage_absorption_time_means(
         res[f"{name} mean"] = mean
 
         if moment == "var":
-            logg.debug(f"Calculating variance of mean time to absorption to `{name!r}`")
+            logg.debug("Calculating variance of mean time to absorption to `%r`", name)
 
             logg.debug("Solving equation (1/2)")
             X = _solve_lin_system(D_j + Q @ D_j, N_inv @ D_j, use_eye=False, **kwargs)
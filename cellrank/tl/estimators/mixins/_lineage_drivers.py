@@ -189,8 +189,11 @@ class LinDriversMixin(AbsProbsMixin):
             var_names = adata_comp.var_names
 
         start = logg.debug(
-            f"Computing correlations for lineages `{sorted(lineages)}` restricted to clusters `{clusters}` in "
-            f"layer `{'X' if layer is None else layer}` with `use_raw={use_raw}`"
+            "Computing correlations for lineages `%s` restricted to clusters `%s` in layer `%s` with `use_raw=%s`",
+            sorted(lineages),
+            clusters,
+            "X" if layer is None else layer,
+            use_raw,
         )
 
         lin_probs = lin_probs[lineages]
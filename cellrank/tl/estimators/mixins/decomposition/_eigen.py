@@ -100,7 +100,7 @@ class EigenMixin:
         start = logg.info("Computing eigendecomposition of the transition matrix")
 
         if issparse(self.transition_matrix):
-            logg.debug(f"Computing top `{k}` eigenvalues of a sparse matrix")
+            logg.debug("Computing top `%s` eigenvalues of a sparse matrix", k)
             D, V_l = eigs(self.transition_matrix.T, k=k, which=which, ncv=ncv)
             if only_evals:
                 self._write_eigendecomposition(
@@ -197,7 +197,12 @@ class CFLARE(TermStatesEstimator, LinDriversMixin, EigenMixin):
                 )
 
         # fmt: off
-        logg.debug(f"Using `{use}` eigenvectors, basis `{basis!r}` and method `{method!r}` for clustering")
+        logg.debug(
+            "Using `%s` eigenvectors, basis `%r` and method `%r` for clustering",
+            use,
+            basis,
+            method,
+        )
         clusters = _cluster_X(
             X,
             method=method,
@@ -217,7 +222,7 @@ class CFLARE(TermStatesEstimator, LinDriversMixin, EigenMixin):
 
         # filtering to get rid of some of the left over transient states
         if n_matches_min > 0:
-            logg.debug(f"Filtering according to `n_matches_min={n_matches_min}`")
+            logg.debug("Filtering according to `n_matches_min=%s`", n_matches_min)
             distances = _get_connectivities(self.adata, mode="distances", n_neighbors=n_neighbors_filtering)
             labels = _filter_cells(distances, rc_labels=labels, n_matches_min=n_matches_min)
         # fmt: on
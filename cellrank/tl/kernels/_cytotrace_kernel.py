@@ -1,4 +1,4 @@
-from typing import Any, List, Tuple, Optional
+from typing import Any, List, Tuple, Callable, Optional
 from typing_extensions import Literal
 
 from enum import auto
@@ -8,13 +8,14 @@ from cellrank import logging as logg
 from cellrank._key import Key
 from cellrank.tl._enum import ModeEnum
 from cellrank.ul._docs import d, inject_docs
-from cellrank.tl._utils import _correlation_test
+from cellrank.tl._utils import _mat_vec_corr
+from cellrank.tl.kernels._utils import _np_row_mean
 from cellrank.tl.kernels._pseudotime_kernel import PseudotimeKernel
 
 import numpy as np
 import pandas as pd
 from scipy.stats import gmean, hmean
-from scipy.sparse import issparse
+from scipy.sparse import issparse, spmatrix, csr_matrix
 
 __all__ = ("CytoTRACEKernel",)
 
@@ -26,6 +27,39 @@ class CytoTRACEAggregation(ModeEnum):
     HMEAN = auto()
 
 
+def _sparse_row_mean(
+    X: spmatrix,
+    func: Callable[[np.ndarray], np.ndarray],
+    inverse: Callable[[np.ndarray], np.ndarray],
+) -> np.ndarray:
+    """
+    Compute a generalized mean of each row of a non-negative sparse matrix.
+
+    Parameters
+    ----------
+    X
+        Sparse matrix of shape ``(n_cells, n_genes)``.
+    func
+        Function applied to the values, such as :func:`numpy.log` for the geometric mean.
+    inverse
+        Inverse of ``func``, applied to the arithmetic mean of the transformed values.
+
+    Returns
+    -------
+    Array of shape ``(n_cells,)``. Rows containing any zero are `0`, same as for the dense version.
+    """
+    X = csr_matrix(X)
+    # keep single precision, same as `scipy`, but don't apply `func` to integers
+    data = X.data.astype(np.result_type(X.dtype, np.float32), copy=False)
+    with np.errstate(divide="ignore"):
+        transformed = csr_matrix((func(data), X.indices, X.indptr), shape=X.shape)
+        res = inverse(np.ravel(transformed.sum(axis=1)) / X.shape[1])
+    # rows with implicit zeros, explicit zeros have already been mapped to `0` above
+    res[np.diff(X.indptr) < X.shape[1]] = 0
+
+    return res
+
+
 @d.dedent
 class CytoTRACEKernel(PseudotimeKernel):
     """
@@ -161,8 +195,6 @@ class CytoTRACEKernel(PseudotimeKernel):
         This will not exactly reproduce the results of the original CytoTRACE algorithm :cite:`gulati:20` because we
         allow for any normalization and imputation techniques whereas CytoTRACE has built-in specific methods for that.
         """
-        from cellrank.tl import Lineage
-
         aggregation = CytoTRACEAggregation(aggregation)
 
         if use_raw and self.adata.raw is None:
@@ -181,14 +213,22 @@ class CytoTRACEKernel(PseudotimeKernel):
         start = logg.info(msg)
 
         # compute number of expressed genes per cell
-        num_exp_genes = np.asarray((adata_mraw.X > 0).sum(axis=1)).squeeze()
+        X = adata_mraw.X
+        if issparse(X) and X.format == "csr":
+            # count the positive stored values per row, without creating a boolean matrix
+            expressed = X.data > 0
+            if expressed.all():
+                num_exp_genes = np.diff(X.indptr).astype(np.int64)
+            else:
+                # explicitly stored zeros or negative values
+                expressed = np.r_[0, np.cumsum(expressed)]
+                num_exp_genes = expressed[X.indptr[1:]] - expressed[X.indptr[:-1]]
+        else:
+            num_exp_genes = np.asarray((X > 0).sum(axis=1)).squeeze()
 
         logg.debug("Correlating all genes with number of genes expressed per cell")
-        gene_corr = _correlation_test(
-            adata_mraw.X,
-            Lineage(num_exp_genes[:, None], names=["gene"]),
-            gene_names=adata_mraw.var_names,
-        )["gene_corr"]
+        gene_corr = _mat_vec_corr(adata_mraw.X, num_exp_genes)
+        gene_corr = pd.Series(gene_corr, index=adata_mraw.var_names)
 
         cytotrace_score, pos_top_genes = self._compute_score(
             gene_corr,
@@ -206,8 +246,9 @@ class CytoTRACEKernel(PseudotimeKernel):
         )
         self.adata.obs[Key.cytotrace("num_exp_genes")] = num_exp_genes
         self.adata.var[Key.cytotrace("gene_corr")] = gene_corr
-        self.adata.var[Key.cytotrace("correlates")] = False
-        self.adata.var.loc[pos_top_genes, Key.cytotrace("correlates")] = True
+        correlates = np.zeros(self.adata.n_vars, dtype=bool)
+        correlates[self.adata.var_names.get_indexer(pos_top_genes)] = True
+        self.adata.var[Key.cytotrace("correlates")] = correlates
         self.adata.uns[Key.cytotrace("params")] = {
             "aggregation": aggregation,
             "layer": layer,
@@ -243,8 +284,15 @@ class CytoTRACEKernel(PseudotimeKernel):
         modifier = "negatively" if ascending else "positively"
         if n_genes <= 0:
             raise ValueError(f"Expected number of {modifier} correlated genes to be positive, found `{n_genes}`.")
-        top_genes = [g for g in gene_corr.sort_values(ascending=ascending).index if g in self.adata.var_names]
-        top_genes = top_genes[:n_genes]
+        gene_corr = gene_corr[gene_corr.index.isin(self.adata.var_names)]
+        values = gene_corr.values if ascending else -gene_corr.values
+        if n_genes < len(values):
+            # partially select the top genes, `NaN` values are placed last, same as when sorting
+            ixs = np.argpartition(values, n_genes - 1)[:n_genes]
+            ixs = ixs[np.argsort(values[ixs])]
+        else:
+            ixs = np.argsort(values)
+        top_genes = gene_corr.index[ixs].tolist()
         invalid_genes = int(gene_corr.loc[top_genes].isnull().sum())
         # fmt: on
 
@@ -262,24 +310,37 @@ class CytoTRACEKernel(PseudotimeKernel):
             )
 
         # fmt: off
-        if layer == "X":
-            imputed_exp = self.adata[:, top_genes].X
-        else:
-            imputed_exp = self.adata[:, top_genes].layers[layer]
-        if issparse(imputed_exp) and aggregation not in (CytoTRACEAggregation.MEAN, CytoTRACEAggregation.MEDIAN):
+        # index the matrix directly, creating an `AnnData` view is much more expensive
+        X = self.adata.X if layer == "X" else self.adata.layers[layer]
+        imputed_exp = X[:, self.adata.var_names.get_indexer(top_genes)]
+        if (
+            issparse(imputed_exp)
+            and aggregation not in (CytoTRACEAggregation.MEAN, CytoTRACEAggregation.MEDIAN)
+            and np.any(imputed_exp.data < 0)
+        ):
+            # the sparse means below assume non-negative values, let `scipy` handle the rest
             imputed_exp = imputed_exp.A
 
         if aggregation == CytoTRACEAggregation.MEAN:
-            cytotrace_score = np.asarray(imputed_exp.mean(axis=1)).reshape((-1,))
+            if issparse(imputed_exp):
+                cytotrace_score = np.asarray(imputed_exp.mean(axis=1)).reshape((-1,))
+            else:
+                cytotrace_score = _np_row_mean(np.ascontiguousarray(imputed_exp))
         elif aggregation == CytoTRACEAggregation.MEDIAN:
             if issparse(imputed_exp):
                 cytotrace_score = np.asarray(csc_median_axis_0(imputed_exp.T.tocsc())).reshape((-1,))
             else:
                 cytotrace_score = np.median(imputed_exp, axis=1)
         elif aggregation == CytoTRACEAggregation.GMEAN:
-            cytotrace_score = gmean(imputed_exp, axis=1)
+            if issparse(imputed_exp):
+                cytotrace_score = _sparse_row_mean(imputed_exp, func=np.log, inverse=np.exp)
+            else:
+                cytotrace_score = gmean(imputed_exp, axis=1)
         elif aggregation == CytoTRACEAggregation.HMEAN:
-            cytotrace_score = hmean(imputed_exp, axis=1)
+            if issparse(imputed_exp):
+                cytotrace_score = _sparse_row_mean(imputed_exp, func=np.reciprocal, inverse=np.reciprocal)
+            else:
+                cytotrace_score = hmean(imputed_exp, axis=1)
         else:
             raise NotImplementedError(f"Aggregation method `{aggregation}` is not yet implemented.")
         # fmt: on
@@ -7,7 +7,7 @@ from cellrank.tl._utils import _connected, _symmetric
 from cellrank.ul._utils import _get_neighs
 
 import numpy as np
-from scipy.sparse import spdiags, spmatrix, csr_matrix
+from scipy.sparse import issparse, spmatrix, csr_matrix
 
 __all__ = ("ConnectivityMixin", "UnidirectionalMixin", "BidirectionalMixin")
 
@@ -51,10 +51,17 @@ class ConnectivityMixin:
         """
         logg.debug("Density normalizing the transition matrix")
 
-        q = np.asarray(self._conn.sum(axis=0)).squeeze()
-        Q = spdiags(1.0 / q, 0, matrix.shape[0], matrix.shape[0])
+        # same as `Q @ matrix @ Q` for `Q = diag(1 / q)`, but scales the values in a single pass
+        d = 1.0 / np.asarray(self._conn.sum(axis=0)).squeeze()
+        if not issparse(matrix):
+            return matrix * d[:, None] * d[None, :]
 
-        return Q @ matrix @ Q
+        matrix = csr_matrix(
+            matrix, dtype=np.result_type(matrix.dtype, d.dtype), copy=True
+        )
+        matrix.data *= np.repeat(d, np.diff(matrix.indptr)) * d[matrix.indices]
+
+        return matrix
 
 
 class UnidirectionalMixin:
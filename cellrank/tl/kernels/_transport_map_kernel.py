@@ -109,10 +109,10 @@ class TransportMapKernel(ExperimentalTimeKernel, ABC):
 
             if threshold == "auto_local":
                 thresh = min(tmat[i].max() for i in range(tmat.shape[0]))
-                logg.debug(f"Using `threshold={thresh}` at `{key}`")
+                logg.debug("Using `threshold=%s` at `%s`", thresh, key)
             elif isinstance(threshold, (int, float)):
                 thresh = np.percentile(tmat.data, threshold)
-                logg.debug(f"Using `threshold={thresh}` at `{key}`")
+                logg.debug("Using `threshold=%s` at `%s`", thresh, key)
 
             tmat = csr_matrix(tmat, dtype=tmat.dtype)
             tmat.data[tmat.data < thresh] = 0.0
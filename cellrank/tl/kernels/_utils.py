@@ -76,6 +76,34 @@ def norm(array: np.ndarray, axis: int) -> np.ndarray:  # noqa
     return _np_apply_along_axis(np.linalg.norm, axis, array)
 
 
+@njit(parallel=True, **jit_kwargs)
+def _np_row_mean(array: np.ndarray) -> np.ndarray:
+    """
+    Compute the mean of each row in parallel.
+
+    Parameters
+    ----------
+    array
+        Array of shape ``(n, m)``.
+
+    Returns
+    -------
+    Array of shape ``(n,)`` containing the means, accumulated in double precision.
+    """
+
+    assert array.ndim == 2
+
+    n, m = array.shape
+    result = np.empty(n)
+    for i in prange(n):
+        s = 0.0
+        for j in range(m):
+            s += array[i, j]
+        result[i] = s / m
+
+    return result
+
+
 # this is faster than using flat array
 @njit(parallel=True)
 def _random_normal(
@@ -267,7 +295,7 @@ def _ensure_numeric_ordered(adata: AnnData, key: str) -> pd.Series:
             ) from e
 
     if not is_categorical_dtype(exp_time):
-        logg.debug(f"Converting `adata.obs[{key!r}]` to `categorical`")
+        logg.debug("Converting `adata.obs[%r]` to `categorical`", key)
         exp_time = np.asarray(exp_time)
         categories = sorted(set(exp_time[~np.isnan(exp_time)]))
         if len(categories) > 100:
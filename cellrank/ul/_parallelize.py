@@ -78,7 +78,8 @@ def parallelize(
                         f"Finished only `{n_finished}` out of `{n_total}` tasks.`"
                     ) from e
                 break
-            assert res in (None, (1, None), 1)  # (None, 1) means only 1 job
+            # (None, 1) means only 1 job, integers are the number of processed items
+            assert res is None or res == (1, None) or isinstance(res, int), res
             if res == (1, None):
                 n_finished += 1
                 if pbar is not None:
@@ -86,7 +87,7 @@ def parallelize(
             elif res is None:
                 n_finished += 1
             elif pbar is not None:
-                pbar.update()
+                pbar.update(res)
 
         if pbar is not None:
             pbar.close()
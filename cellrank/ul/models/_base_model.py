@@ -1211,7 +1211,8 @@ class BaseModel(IOMixin, ABC, metaclass=BaseModelMeta):
                 return key, self.adata.obs[key].values, ColorType.CONT, None
 
             logg.debug(
-                f"Unable to interpret cell color from type `{infer_dtype(self.adata.obs[key])}`"
+                "Unable to interpret cell color from type `%s`",
+                infer_dtype(self.adata.obs[key]),
             )
             return None, "black", ColorType.STR, None
 
@@ -1233,8 +1234,9 @@ class BaseModel(IOMixin, ABC, metaclass=BaseModelMeta):
             )
         except KeyError:
             logg.debug(
-                f"Key `{key!r}` not found in `adata.obs` or "
-                f"`adata{'.raw' if self._use_raw else ''}.var_names`. Ignoring`"
+                "Key `%r` not found in `adata.obs` or `adata%s.var_names`. Ignoring`",
+                key,
+                ".raw" if self._use_raw else "",
             )
 
         if same_plot or np.allclose(self.w_all, 1.0):
@@ -476,7 +476,7 @@ def _get_knotlocs(
     else:
         knotlocs = x
 
-    logg.debug(f"Setting knot locations to `{list(knotlocs)}`")
+    logg.debug("Setting knot locations to `%s`", list(knotlocs))
 
     return knotlocs
 
@@ -514,10 +514,10 @@ def _get_offset(
     """
     with np.errstate(divide="ignore", invalid="ignore"):
         if not recompute and isinstance(adata, AnnData) and _OFFSET_KEY in adata.obs:
-            logg.debug(f"Fetching offset from `adata.obs[{_OFFSET_KEY!r}]`")
+            logg.debug("Fetching offset from `adata.obs[%r]`", _OFFSET_KEY)
             return adata.obs[_OFFSET_KEY].values.copy()
 
-        logg.debug(f"Calculating offset for `{adata.shape[0]}` cells")
+        logg.debug("Calculating offset for `%s` cells", adata.shape[0])
 
         data = _extract_data(adata, layer=layer, use_raw=use_raw)
         try:
@@ -526,7 +526,8 @@ def _get_offset(
             )
         except Exception as e:  # noqa: B902
             logg.debug(
-                f"Unable to calculate the normalization factors, setting them to `1`. Reason: `{e}`"
+                "Unable to calculate the normalization factors, setting them to `1`. Reason: `%s`",
+                e,
             )
             nf = np.ones(len(adata), dtype=np.float64)
 
@@ -43,7 +43,7 @@ import numpy as np
 import pandas as pd
 from scipy.sparse import eye as speye
 from scipy.sparse import random as sprandom
-from scipy.sparse import spmatrix, isspmatrix_csr
+from scipy.sparse import spmatrix, csr_matrix, isspmatrix_csr
 from pandas.core.dtypes.common import is_bool_dtype, is_integer_dtype
 
 _rtol = 1e-6
@@ -690,6 +690,23 @@ class TestKernel:
         assert T_sc.shape == T_cr.shape
         np.testing.assert_allclose(T_cr.A, T_cr.A)
 
+    @pytest.mark.parametrize("dense", [False, True])
+    def test_density_normalize(self, adata: AnnData, dense: bool):
+        ck = ConnectivityKernel(adata)
+        matrix = sprandom(adata.n_obs, adata.n_obs, density=0.1, format="csr")
+        q = np.asarray(ck._conn.sum(axis=0)).squeeze()
+        Q = np.diag(1.0 / q)
+        expected = Q @ matrix.A @ Q
+
+        actual = ck._density_normalize(matrix.A if dense else matrix)
+
+        if dense:
+            assert isinstance(actual, np.ndarray)
+        else:
+            assert isspmatrix_csr(actual)
+            actual = actual.A
+        np.testing.assert_allclose(actual, expected)
+
     def test_connectivities_key_kernel(self, adata: AnnData):
         key = "foobar"
         assert key not in adata.obsp
@@ -1146,6 +1163,28 @@ class TestCytoTRACEKernel:
         _ = CytoTRACEKernel(adata).compute_cytotrace(aggregation=agg)
         assert adata.uns[Key.cytotrace("params")]["aggregation"] == agg
 
+    @pytest.mark.parametrize(
+        "agg", [CytoTRACEAggregation.GMEAN, CytoTRACEAggregation.HMEAN]
+    )
+    def test_sparse_aggregation(self, adata: AnnData, agg: CytoTRACEAggregation):
+        rng = np.random.RandomState(42)
+        X = rng.uniform(0.5, 2, size=adata.shape)
+        # only every other cell contains zeros
+        X[::2][rng.uniform(size=X[::2].shape) < 0.1] = 0
+        X = csr_matrix(X)
+        X.data[1:100:10] = 0  # explicit zeros in the cells without implicit ones
+
+        adata.layers["sparse"] = X
+        adata.layers["dense"] = X.A
+        bdata = adata.copy()
+        _ = CytoTRACEKernel(adata).compute_cytotrace(layer="sparse", aggregation=agg)
+        _ = CytoTRACEKernel(bdata).compute_cytotrace(layer="dense", aggregation=agg)
+
+        np.testing.assert_allclose(
+            adata.obs[Key.cytotrace("score")], bdata.obs[Key.cytotrace("score")]
+        )
+        assert np.any(adata.obs[Key.cytotrace("score")] > 0)
+
     @pytest.mark.parametrize("use_raw", [False, True])
     def test_raw(self, adata: AnnData, use_raw: bool):
         _ = CytoTRACEKernel(adata).compute_cytotrace(use_raw=use_raw)
@@ -1188,6 +1227,20 @@ class TestCytoTRACEKernel:
         np.testing.assert_array_equal(k.pseudotime.min(), 0.0)
         np.testing.assert_array_equal(k.pseudotime.max(), 1.0)
 
+    def test_num_exp_genes_explicit_zeros(self, adata: AnnData):
+        X = csr_matrix(adata.X, dtype=np.float64, copy=True)
+        X.data[::3] = 0
+        X.data[1::3] *= -1
+        adata.X = X
+        expected = (X.A > 0).sum(axis=1)
+        assert X.nnz != expected.sum()
+
+        _ = CytoTRACEKernel(adata).compute_cytotrace(layer="X")
+
+        np.testing.assert_array_equal(
+            adata.obs[Key.cytotrace("num_exp_genes")].values, expected
+        )
+
     def test_raw_less_genes(self, adata: AnnData):
         adata.raw = adata.raw.to_adata()[:, :20]
         _ = CytoTRACEKernel(adata).compute_cytotrace(use_raw=True, n_genes=31)
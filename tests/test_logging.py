@@ -4,6 +4,8 @@ import sys
 import pytest
 from io import StringIO
 from datetime import datetime
+from importlib.util import find_spec
+from logging.handlers import MemoryHandler
 
 from scanpy import Verbosity
 from cellrank import logging as logg
@@ -93,3 +95,97 @@ class TestLogging:
         assert counter == 4 and capsys.readouterr().err == "4 (0:00:02)\n"
         logg.info("5 {time_passed}", time=start)
         assert counter == 5 and capsys.readouterr().err == "5 0:00:03\n"
+
+    def test_disabled_level_returns_time(self, capsys, logging_state):
+        settings.logfile = sys.stderr
+        settings.verbosity = Verbosity.warn
+
+        start = logg.hint("0")
+        assert isinstance(start, datetime)
+        assert capsys.readouterr().err == ""
+
+        settings.verbosity = Verbosity.info
+        logg.info("1", time=start)
+        assert capsys.readouterr().err.startswith("1 (")
+
+    def test_lazy_args(self, capsys, logging_state):
+        settings.logfile = sys.stderr
+        settings.verbosity = Verbosity.hint
+
+        logg.info("foo `%r` and `%s`", "bar", 42)
+        assert capsys.readouterr().err == "foo `'bar'` and `42`\n"
+        logg.hint("%d%%", 100, deep="baz")
+        assert capsys.readouterr().err == "--> 100%\n"
+        settings.verbosity = Verbosity.debug
+        logg.hint("progress %d%%", 50, deep="at 10% done")
+        assert capsys.readouterr().err == "--> progress 50%: at 10% done\n"
+        logg.hint("progress 50%", deep="at 10% done")
+        assert capsys.readouterr().err == "--> progress 50%: at 10% done\n"
+
+    def test_buffered(self, monkeypatch, logging_state):
+        from cellrank.settings._settings import _LOG_BUFFER_ENV, _set_log_file
+
+        io = StringIO()
+        settings.logfile = io
+        settings.verbosity = Verbosity.info
+        monkeypatch.setenv(_LOG_BUFFER_ENV, "2")
+        _set_log_file(settings)
+        (handler,) = settings._root_logger.handlers
+        assert isinstance(handler, MemoryHandler)
+
+        logg.info("0")
+        assert io.getvalue() == ""
+        logg.info("1")
+        assert io.getvalue() == "0\n1\n"
+        logg.info("2")
+        logg.error("3")
+        assert io.getvalue() == "0\n1\n2\nERROR: 3\n"
+
+        monkeypatch.delenv(_LOG_BUFFER_ENV)
+        _set_log_file(settings)
+        assert not isinstance(settings._root_logger.handlers[0], MemoryHandler)
+
+    def test_print_versions(self, capsys, logging_state):
+        from cellrank.logging._logging import (
+            _DEPENDENCIES_NUMERICS,
+            _DEPENDENCIES_PLOTTING,
+        )
+
+        settings.logfile = sys.stdout
+        logg.print_versions()
+        printed = dict(v.split("==") for v in capsys.readouterr().out.split())
+
+        assert "cellrank" in printed
+        for mod in _DEPENDENCIES_NUMERICS + _DEPENDENCIES_PLOTTING:
+            mod_name, dist_names = mod if isinstance(mod, tuple) else (mod, mod)
+            if isinstance(dist_names, str):
+                dist_names = (dist_names,)
+            if find_spec(mod_name) is not None:
+                assert any(name in printed for name in dist_names), mod_name
+
+    def test_buffered_logfile_change(self, monkeypatch, logging_state):
+        from cellrank.settings._settings import _LOG_BUFFER_ENV, _set_log_file
+
+        io, io_new = StringIO(), StringIO()
+        settings.logfile = io
+        settings.verbosity = Verbosity.info
+        monkeypatch.setenv(_LOG_BUFFER_ENV, "10")
+        _set_log_file(settings)
+
+        logg.info("0")
+        logg.info("1")
+        assert io.getvalue() == ""
+        settings.logfile = io_new
+        assert io.getvalue() == "0\n1\n"
+
+        logg.info("2")
+        assert io_new.getvalue() == "2\n"
+
+    def test_buffered_invalid_env(self, monkeypatch, logging_state):
+        from cellrank.settings._settings import _LOG_BUFFER_ENV, _set_log_file
+
+        settings.logfile = StringIO()
+        monkeypatch.setenv(_LOG_BUFFER_ENV, "yes")
+        with pytest.warns(UserWarning, match=_LOG_BUFFER_ENV):
+            _set_log_file(settings)
+        assert not isinstance(settings._root_logger.handlers[0], MemoryHandler)
@@ -1,4 +1,4 @@
-from typing import Any, Optional
+from typing import Any, List, Optional
 
 import pytest
 from _helpers import create_model, assert_array_nan_equal, jax_not_installed_skip
@@ -8,6 +8,7 @@ from anndata import AnnData
 from cellrank.tl import Lineage
 from anndata.utils import make_index_unique
 from cellrank.pl._utils import (
+    _curved_edges,
     _create_models,
     _create_callbacks,
     _default_model_callback,
@@ -33,6 +34,7 @@ from cellrank.tl.kernels._utils import (
     np_max,
     np_sum,
     np_mean,
+    _np_row_mean,
     _random_normal,
     _reconstruct_one,
     _calculate_starts,
@@ -178,6 +180,14 @@ class TestToolsUtils:
         assert not _symmetric(test_matrix_1)
         assert _symmetric(test_matrix_4)
 
+    def test_matrix_symmetry_sparse(
+        self, test_matrix_1: np.ndarray, test_matrix_4: np.ndarray
+    ):
+        assert not _symmetric(csr_matrix(test_matrix_1))
+        assert _symmetric(csr_matrix(test_matrix_4))
+        assert not _symmetric(csr_matrix(test_matrix_1), ord=1)
+        assert _symmetric(csr_matrix(test_matrix_4), ord=1)
+
     def test_matrix_partition(
         self,
         test_matrix_1: np.ndarray,
@@ -566,6 +576,18 @@ class TestCreateModels:
         assert isinstance(models["foo"]["bar"], type(m))
         assert models["foo"]["bar"] is not m
 
+    def test_create_models_1_model_lazy_copy(self, adata: AnnData):
+        m = create_model(adata)
+        models = _create_models(m, ["foo", "bar"], ["baz", "quux"])
+
+        assert models["foo"]._models == {}
+        assert list(models["foo"].keys()) == ["baz", "quux"]
+        assert models["foo"]["baz"] is models["foo"]["baz"]
+        assert models["foo"]["baz"] is not models["foo"]["quux"]
+        assert models["foo"]["baz"] is not models["bar"]["baz"]
+        with pytest.raises(KeyError):
+            _ = models["foo"]["quas"]
+
     def test_create_models_gene_specific(self, adata: AnnData):
         m1 = create_model(adata)
         m2 = GAM(adata)
@@ -874,6 +896,48 @@ class TestCreateCallbacks:
         assert cbs[g]["1"] is cb2
 
 
+class TestCurvedEdges:
+    @pytest.mark.parametrize("polarity", ["random", "directed", "fixed"])
+    def test_axis_aligned_edges(self, polarity: str):
+        import networkx as nx
+
+        G = nx.DiGraph([(0, 1), (1, 2), (2, 0), (2, 2)])
+        pos = {0: [0.0, 0.0], 1: [0.0, 1.0], 2: [1.0, 1.0]}
+
+        curves = _curved_edges(G, pos, 0.1, bezier_precision=10, polarity=polarity)
+
+        assert curves.shape == (4, 10, 2)
+        assert np.all(np.isfinite(curves))
+        # the curves start and end at the nodes
+        np.testing.assert_allclose(curves[0, [0, -1]], [[0.0, 0.0], [0.0, 1.0]])
+        np.testing.assert_allclose(curves[1, [0, -1]], [[0.0, 1.0], [1.0, 1.0]])
+
+    @pytest.mark.parametrize("nodes", [[0, 1, 2, 3], [-1, 0, 5, 2**62]])
+    def test_fixed_polarity_integer_nodes(self, nodes: List[int]):
+        import networkx as nx
+
+        G = nx.DiGraph(
+            [(nodes[i], nodes[j]) for i in range(4) for j in range(4) if i != j]
+        )
+        pos = {n: [i, i**2 % 3] for i, n in enumerate(nodes)}
+        # floats have the same hash as the integers, but don't use the integer fast path
+        G_float = nx.relabel_nodes(G, float)
+        pos_float = {float(n): p for n, p in pos.items()}
+
+        curves = _curved_edges(G, pos, 0.1, polarity="fixed")
+        curves_float = _curved_edges(G_float, pos_float, 0.1, polarity="fixed")
+
+        np.testing.assert_array_equal(curves, curves_float)
+
+    def test_invalid_polarity(self):
+        import networkx as nx
+
+        with pytest.raises(ValueError, match=r"Polarity `'foo'` is not"):
+            _ = _curved_edges(
+                nx.DiGraph([(0, 1)]), {0: [0, 0], 1: [1, 1]}, 0.1, polarity="foo"
+            )
+
+
 class TestClusterX:
     def test_normal_run_leiden(self):
         # create some data
@@ -923,6 +987,15 @@ class TestKernelUtils:
                     fn(x, axis=axis), _create_numba_fn(fn)(axis, x)
                 )
 
+    @pytest.mark.parametrize("dtype", [np.float32, np.float64, np.int64])
+    def test_row_mean(self, dtype: type):
+        x = np.random.RandomState(42).normal(scale=10, size=(100, 20)).astype(dtype)
+
+        res = _np_row_mean(x)
+
+        assert res.dtype == np.float64
+        np.testing.assert_allclose(res, x.mean(axis=1, dtype=np.float64))
+
     def test_zero_unif_sum_to_1_vector(self):
         sum_to_1, zero = _get_probs_for_zero_vec(10)
 